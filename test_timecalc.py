@@ -0,0 +1,196 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+import timecalc
+
+
+class ExpressionParsingTest(unittest.TestCase):
+    """Regression checks for the tokenizer and operator validation"""
+
+    def setUp(self):
+        # The calculation engine needs no Tk state, so skip __init__
+        self.calc = object.__new__(timecalc.AdvancedTimeCalculator)
+
+    def calculate(self, expression):
+        return self.calc.parse_and_calculate(expression)
+
+    def test_signed_operands(self):
+        self.assertEqual(self.calculate('-1h + 2h'), timedelta(hours=1))
+        self.assertEqual(self.calculate('+2h + 1h'), timedelta(hours=3))
+        self.assertEqual(self.calculate('-5 * 1h'), timedelta(hours=-5))
+        self.assertEqual(self.calculate('1h * -2'), timedelta(hours=-2))
+        self.assertEqual(self.calculate('1h - -30m'), timedelta(hours=1, minutes=30))
+        self.assertEqual(self.calculate('1h ++ 1h'), timedelta(hours=2))
+
+    def test_number_forms(self):
+        self.assertEqual(self.calculate('.5 * 2h'), timedelta(hours=1))
+        self.assertEqual(self.calculate('5. * 1h'), timedelta(hours=5))
+        self.assertEqual(self.calculate('1e2 * 1m'), timedelta(minutes=100))
+        self.assertEqual(self.calculate('2.5e1 * 1s'), timedelta(seconds=25))
+        self.assertEqual(self.calculate('.5h + 1h'), timedelta(hours=1, minutes=30))
+
+    def test_duration_units_share_one_grammar(self):
+        self.assertEqual(self.calculate('2.5h + 0s'), timedelta(hours=2, minutes=30))
+        self.assertEqual(self.calculate('1.5d + 0s'), timedelta(days=1, hours=12))
+        for expression in ('5.h + 0s', '5.m + 0s', '\u0665h + 1h'):
+            with self.subTest(expression=expression):
+                with self.assertRaisesRegex(ValueError, 'Cannot parse duration'):
+                    self.calculate(expression)
+
+    def test_date_forms(self):
+        self.assertEqual(self.calculate('2025/8/19 + 1d'), datetime(2025, 8, 20))
+        self.assertEqual(self.calculate('2025-8-19 + 1d'), datetime(2025, 8, 20))
+        self.assertEqual(self.calculate('2025-08-19T10:00 + 1h'), datetime(2025, 8, 19, 11))
+        self.assertEqual(self.calculate('2025-08-19 2:30:5 pm + 1h'),
+                         datetime(2025, 8, 19, 15, 30, 5))
+
+    def test_bare_date_separator_is_rejected(self):
+        self.assertIsNone(timecalc._parse_datetime('2025-08-19T'))
+        self.assertEqual(timecalc._parse_datetime('2025-08-19T9:05'), datetime(2025, 8, 19, 9, 5))
+        with self.assertRaises(ValueError):
+            self.calculate('2025-08-19T + 1h')
+
+    def test_operators_must_alternate(self):
+        cases = {
+            '2h + 1h +': "ends with operator '\\+'",
+            '1h + * 2h': "found operator '\\*'",
+            '30 m + 1h': "between '30' and 'm'",
+            '1h + 2 m': "between '2' and 'm'",
+        }
+        for expression, message in cases.items():
+            with self.subTest(expression=expression):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.calculate(expression)
+
+    def test_invalid_time_names_token(self):
+        with self.assertRaisesRegex(ValueError, '1:2'):
+            self.calculate('1:2 + 1h')
+
+    def test_every_term_is_evaluated(self):
+        now = datetime(2025, 8, 19, 10, 0)
+        self.assertEqual(self.calc.parse_and_calculate('3d + now + 1h', now),
+                         datetime(2025, 8, 22, 11, 0))
+        self.assertEqual(self.calc.parse_and_calculate('1h + now - 30m', now),
+                         datetime(2025, 8, 19, 10, 30))
+
+
+
+class ProgressTest(unittest.TestCase):
+    """Regression checks for progress estimates"""
+
+    def setUp(self):
+        self.calc = object.__new__(timecalc.AdvancedTimeCalculator)
+
+    def calculate(self, expression):
+        return self.calc.parse_and_calculate(expression)
+
+    def test_percentage_bounds(self):
+        self.assertEqual(self.calculate('progress(1h, 99.99999999%)'), timedelta(hours=1))
+        self.assertEqual(self.calculate('progress(1h, 12.5%)'), timedelta(hours=8))
+        for percentage in ('0', '0.0', '100', '100.0', '150'):
+            with self.subTest(percentage=percentage):
+                with self.assertRaisesRegex(ValueError, 'between 0 and 100'):
+                    self.calculate(f'progress(1h, {percentage}%)')
+
+    def test_eta_shares_the_now_clock_reading(self):
+        self.assertEqual(self.calculate('progress(1h, 50%, eta) - now'), timedelta(hours=1))
+
+    def test_shorthand_syntax(self):
+        total = timedelta(hours=6, minutes=41, seconds=40)
+        self.assertEqual(self.calculate('1h15s@15%'), total)
+        self.assertEqual(self.calculate('1h15s @ 15%'), total)
+        self.assertEqual(self.calculate('15% in 1h15s'), total)
+        self.assertEqual(self.calculate('progress(1h15s, 15%)'), total)
+
+    def test_shorthand_inside_expression(self):
+        now = datetime(2025, 8, 19, 10, 0)
+        self.assertEqual(self.calc.parse_and_calculate('now + 1h@50%', now),
+                         datetime(2025, 8, 19, 12, 0))
+
+
+
+def _format_by_scan(bytes_value):
+    """The original largest-unit-first scan, kept as a reference"""
+    if bytes_value == 0:
+        return "0 B"
+    for unit, factor in reversed(timecalc._DATA_FORMAT_UNITS):
+        if bytes_value >= factor:
+            value = bytes_value / factor
+            if value >= 100:
+                return f"{value:.0f} {unit}"
+            elif value >= 10:
+                return f"{value:.1f} {unit}"
+            else:
+                return f"{value:.2f} {unit}"
+    return f"{bytes_value} B"
+
+
+class DataAmountTest(unittest.TestCase):
+    """Regression checks for data-amount parsing and formatting"""
+
+    def setUp(self):
+        self.calc = object.__new__(timecalc.AdvancedTimeCalculator)
+
+    def test_parse_units(self):
+        cases = {
+            '5GB': 5e9,
+            '1.5 gb': 1.5e9,
+            '2 MiB': 2 * 1024**2,
+            '3kib': 3 * 1024,
+            '10 B': 10,
+            '7 PB': 7e15,
+            '12.5 tib': 12.5 * 1024**4,
+            '0 KB': 0,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.calc.parse_data_amount(text), expected)
+
+    def test_parse_rejects_malformed(self):
+        cases = {
+            'GB': 'Cannot parse data amount',
+            '5': 'Cannot parse data amount',
+            '5 K B': 'Cannot parse data amount',
+            '1e3 KB': 'Cannot parse data amount',
+            '5 XB': 'Cannot parse data amount',
+            '5 ib': 'Unknown data unit: IB',
+            '.5GB': 'Cannot parse data amount',
+            '1.GB': 'Cannot parse data amount',
+            '1.2.3 GB': 'Cannot parse data amount',
+            '\u0665GB': 'Cannot parse data amount',
+        }
+        for text, message in cases.items():
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.calc.parse_data_amount(text)
+
+    def test_format_unit_boundaries(self):
+        cases = {
+            0: '0 B',
+            0.5: '0.5 B',
+            1: '1.00 B',
+            999: '999 B',
+            1000: '1.00 KB',
+            999_999: '1000 KB',
+            1000**2: '1.00 MB',
+            1000**3 - 1: '1000 MB',
+            1000**3: '1.00 GB',
+            1000**5: '1.00 PB',
+            1000**6: '1000 PB',
+        }
+        for bytes_value, expected in cases.items():
+            with self.subTest(bytes_value=bytes_value):
+                self.assertEqual(self.calc.format_data_amount(bytes_value), expected)
+
+    def test_format_matches_unit_scan(self):
+        rng = random.Random(1818)
+        values = [10 ** rng.uniform(-3, 19) for _ in range(20_000)]
+        values += [1000 ** k * (1 + d) for k in range(7) for d in (-1e-15, -1e-12, 0, 1e-12)]
+        for bytes_value in values:
+            self.assertEqual(self.calc.format_data_amount(bytes_value),
+                             _format_by_scan(bytes_value), bytes_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,25 +7,466 @@ Complete rewrite with robust parsing for compound time specifiers and progress c
 import tkinter as tk
 from tkinter import ttk, messagebox
 import re
+import base64
+import functools
+import importlib.util
+import io
+import math
+import operator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import threading
-import math
 
-# Optional dependencies with graceful fallbacks
-try:
-    from PIL import Image, ImageDraw, ImageTk
-    PIL_AVAILABLE = True
-    IMAGETK_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    IMAGETK_AVAILABLE = False
+# Optional dependencies with graceful fallbacks.  Only probe for them here;
+# the actual imports happen on first use so startup doesn't pay for loading
+# PIL and pystray's GTK/AppIndicator bindings.
+# A module being found doesn't mean it imports: the tray UI checks
+# self.tray_icon, which is only set once pystray actually loaded.
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+TRAY_AVAILABLE = PIL_AVAILABLE and importlib.util.find_spec('pystray') is not None  # Tray needs PIL for icons
+
+# 64x64 clock-face-and-plus application icon, pre-rendered to PNG so startup
+# doesn't redraw it (and the window icon doesn't need PIL at all)
+_ICON_PNG_B64 = (
+    'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAACjElEQVR42u1bP2tCMRBPwhsEoXPn'
+    '4tLBzdJR6FIcnQuu0m/Rr9HVL+Do7KybQ5fSubPwwKXY6ZVHMMkld8klNTeKL5f7/e5f7r0IUaVK'
+    'lWsWmVLZZLY4Q/+736xk8QD4GMwFiExp+Kk9gtcYDG+SACFjG+5jtA8YVEDIGIZTGA0FAwuEpDQ+'
+    'puE2IDAgqBKN1/Vhkq0szXBqb1Ccxh+2a3HYrlm9QZXMPAUICqssFqsha4aQonzZdykZT+dRGIau'
+    '2+0P6gWK0nidNYr/hniTDwjKJ+6p2Uqxnmv/iiLuKdmjeh66X0nt+qEGxsodXY9g6g+UuHJRoexT'
+    'l7rY/YEpFyisC+cABGYPKjTzj6fzv7jlAsJX7yW7Gmwm7YPAwTgkeZ7ao3HC1ORQqzn1FVkFKMFW'
+    'qWt/btWg9gEVgExqN1c/0WA3HpKUTMZCQaBMgk3pLowlxBuA1PU+uxCgquNUMY8lhC0EdBC4PIs1'
+    'B+QQTrUP0H/oRkem01OpYhqNkXlAKRMi8hDgGIZQ6mtcbgOZCXIks04/RLctnI1jcchQlDuLQ0mw'
+    'jcaDQyCHEtafS4YK64sRzuyfrA/AJsnYSdYKAFVPgHFTzLMu9r08IAQESuZ814LuF/RBUWgugFQK'
+    'aDkzrfXz9OoN5sfbs/Q6DO03KzmZLc62viBFZ2gCYXh7B16j/f4KOw36gpDTRxLkrXAJB6XdciR2'
+    'yxEtAP1s+l9Oi94eQA0CRTcX7TDkAqHLCVzd4mB4I1rN7S+FghBCPLx/0h+HOUOCSh96JthVh/6m'
+    'Ut4X6EufZRfzZADoIaFvMvaNkfvHlzOrB9iAwICBvTPkYj4KADYgsHEb69ZY1PcC+qZj3RvU29sq'
+    'VaqA5RdabJLuqYf5AQAAAABJRU5ErkJggg=='
+)
+
+# Precompiled patterns for the calculation engine
+_RATE_RE = re.compile(r'^(.+?)\s*@\s*(.+?)\s*->\s*(.+?)$')
+# Compound durations: 1h15s, 2d30m45s, etc.
+_DURATION_PATTERN = r'[0-9]+(?:\.[0-9]+)?[a-zA-Z]+(?:[0-9]+(?:\.[0-9]+)?[a-zA-Z]+)*'
+_AT_PROGRESS_RE = re.compile(rf'({_DURATION_PATTERN})\s*@\s*([0-9]+(?:\.[0-9]+)?)%')
+_IN_PROGRESS_RE = re.compile(rf'([0-9]+(?:\.[0-9]+)?)%\s+in\s+({_DURATION_PATTERN})')
+_PROGRESS_FN_RE = re.compile(r'^\s*progress\s*\([^)]+\)\s*$', re.IGNORECASE)
+_PROGRESS_PARSE_RE = re.compile(
+    r'progress\s*\(\s*([^,]+)\s*,\s*([0-9]+(?:\.[0-9]+)?)%(?:\s*,\s*(\w+))?\s*\)', re.IGNORECASE)
+_TIME_TOKEN = r'\d{1,2}:\d{2}(?::\d{1,2}(?:\.\d+)?)?(?:\s*[ap]m?)?'
+_DURATION_AMOUNT = r'(?:[0-9]+(?:\.[0-9]+)?|\.[0-9]+)'  # ASCII only, unlike \d
+# Bare numbers in every form float() reads: 5, 2.5, .5, 5., 1e2, 2.5e-1
+_NUMBER_PATTERN = r'(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?'
+_TOKEN_RE = re.compile(
+    rf'''(?P<fn>progress\s*\([^)]*\))
+       |(?P<dt>\d{{4}}(?P<dsep>[-/])\d{{1,2}}(?P=dsep)\d{{1,2}}(?:[ T]\s*{_TIME_TOKEN})?)
+       |(?P<us>\d{{1,2}}/\d{{1,2}}/\d{{4}}(?:[ T]\s*{_TIME_TOKEN})?)
+       |(?P<time>{_TIME_TOKEN})
+       |(?P<num>{_NUMBER_PATTERN}(?![a-z\d.:]))  # Not the 2 of 2h or the 1e of 1e2h
+       |(?P<dur>{_DURATION_AMOUNT}[a-z]+(?:\s*{_DURATION_AMOUNT}[a-z]+)*)
+       |(?P<op>[+\-*])
+       |(?P<other>[^\s+\-*]+)  # Anything else is left for parse_value_typed to reject
+    ''', re.IGNORECASE | re.VERBOSE)
+_OPERATORS = frozenset('+-*')
+_NUMBER_RE = re.compile(rf'[+-]?{_NUMBER_PATTERN}\Z')
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+
+# One number-and-unit component of a compound duration.  'mo' is tried
+# before 'm' so months are not read as minutes.
+_DURATION_COMPONENT_RE = re.compile(rf'({_DURATION_AMOUNT})(y|mo|w|d|h|m|s)')
+
+# Length of each duration unit in seconds
+_DURATION_UNIT_SECONDS = {
+    'y': 365.25 * 86400,
+    'mo': 30.44 * 86400,
+    'w': 7 * 86400,
+    'd': 86400,
+    'h': 3600,
+    'm': 60,
+    's': 1,
+}
+
+# Data amount units and their size in bytes
+_DATA_UNIT_LETTERS = 'KMGTPIBkmgtpib'
+_DATA_FACTORS = {
+    # Decimal units (1000-based)
+    'B': 1,
+    'KB': 1000,
+    'MB': 1000**2,
+    'GB': 1000**3,
+    'TB': 1000**4,
+    'PB': 1000**5,
+    # Binary units (1024-based)
+    'KIB': 1024,
+    'MIB': 1024**2,
+    'GIB': 1024**3,
+    'TIB': 1024**4,
+    'PIB': 1024**5,
+}
+
+# Display units for format_data_amount, indexed by power of 1000
+_DATA_FORMAT_UNITS = (
+    ('B', 1),
+    ('KB', 1000),
+    ('MB', 1000**2),
+    ('GB', 1000**3),
+    ('TB', 1000**4),
+    ('PB', 1000**5),
+)
+
+# One classifier for every supported date/time shape.  Its match is built
+# into a datetime directly, so each token is classified once.
+_CLASSIFY_RE = re.compile(r'''
+    ^(?=\d)
+    (?:
+        (?:(?P<year>\d{4})(?P<sep>[-/])(?P<month>\d{1,2})(?P=sep)(?P<day>\d{1,2})   # YYYY-MM-DD, YYYY/MM/DD
+          |(?P<us_month>\d{1,2})/(?P<us_day>\d{1,2})/(?P<us_year>\d{4}))         # MM/DD/YYYY
+        (?:$|[ T]\s*(?=\d))                                                       # T needs a time after it
+    )?
+    (?:(?P<hour>\d{1,2}):(?P<minute>\d{2})
+       (?::(?P<second>\d{1,2})(?:\.(?P<fraction>\d+))?)?
+       \s*(?P<ampm>[ap]m?)?                                                      # 'a'/'p' or 'am'/'pm'
+    )?$
+''', re.IGNORECASE | re.VERBOSE)
+
+# Date given to time-only values (14:30, 9:15a), which also makes them
+# usable as offsets from this base
+_BASE_DATE = datetime(1900, 1, 1)
+
+
+def _datetime_from_match(match):
+    """Build a datetime from a _CLASSIFY_RE match (time-only values use 1900-01-01)"""
+    if match.group('year'):
+        year, month, day = int(match.group('year')), int(match.group('month')), int(match.group('day'))
+    elif match.group('us_year'):
+        year, month, day = int(match.group('us_year')), int(match.group('us_month')), int(match.group('us_day'))
+    else:
+        year, month, day = 1900, 1, 1
+    
+    hours = minutes = seconds = microseconds = 0
+    if match.group('hour'):
+        hours = int(match.group('hour'))
+        minutes = int(match.group('minute'))
+        seconds = int(match.group('second') or 0)
+        fraction = match.group('fraction')
+        if fraction:
+            microseconds = int(fraction[:6].ljust(6, '0'))
+        ampm = match.group('ampm')
+        
+        # Validate components
+        if minutes >= 60 or seconds >= 60:
+            raise ValueError(f"Invalid time: {minutes}m {seconds + microseconds / 1000000}s")
+        
+        # Handle AM/PM
+        if ampm:
+            if not (1 <= hours <= 12):
+                raise ValueError(f"Invalid 12-hour format: {hours}")
+            # _CLASSIFY_RE only admits a/p markers, so the first letter decides
+            if ampm[0] in 'pP':
+                if hours != 12:
+                    hours += 12
+            elif hours == 12:
+                hours = 0
+        elif hours >= 24:
+            raise ValueError(f"Invalid 24-hour format: {hours}")
+    
+    try:
+        return datetime(year, month, day, hours, minutes, seconds, microseconds)
+    except ValueError:
+        # Out-of-range calendar dates such as 2025-02-30
+        raise ValueError(f"Cannot parse datetime: {match.group()}") from None
+
+
+def _match_datetime(text):
+    """Return the _CLASSIFY_RE match for a date/time token, or None"""
+    # Every date or time shape has a separator; durations like 2h30m
+    # are rejected without starting the regex engine
+    if ':' not in text and '-' not in text and '/' not in text:
+        return None
+    return _CLASSIFY_RE.match(text)
+
+
+# Parsed operands are immutable, so repeated tokens (30m, 9:15am, the same
+# date across edits) can be served from a small cache.  'now' never reaches
+# these functions; parse_value_typed resolves it before calling them.
+@functools.lru_cache(maxsize=256)
+def _parse_datetime(time_str):
+    """Enhanced datetime parsing with 'a'/'p' support; None if not a date/time"""
+    match = _match_datetime(time_str.strip())
+    return _datetime_from_match(match) if match else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_duration(duration_str):
+    """Parse duration strings including compound formats like 1h15s"""
+    duration_str = duration_str.strip()
+    if not duration_str.islower():
+        duration_str = duration_str.lower()
+    
+    # Unary sign attached by the tokenizer (-30m, +2h)
+    if duration_str.startswith(('-', '+')):
+        magnitude = _parse_duration(duration_str[1:])
+        return -magnitude if duration_str[0] == '-' else magnitude
+    
+    # Single-unit durations (30m, 2.5h, 1.5w) need no component list
+    match = _DURATION_COMPONENT_RE.fullmatch(duration_str)
+    if match:
+        return timedelta(seconds=float(match.group(1)) * _DURATION_UNIT_SECONDS[match.group(2)])
+    
+    # Parse compound durations
+    components = _DURATION_COMPONENT_RE.findall(duration_str)
+    if not components:
+        raise ValueError(f"Cannot parse duration: {duration_str}")
+    
+    total_seconds = sum(float(amount) * _DURATION_UNIT_SECONDS[unit]
+                        for amount, unit in components)
+    return timedelta(seconds=total_seconds)
+
+
+# Operand type codes used to index the arithmetic dispatch tables
+_DATETIME, _DURATION, _NUMBER = 0, 1, 2
+
+
+def _add_datetimes(a, b):
+    """Add two datetimes, treating the second as an offset from 1900-01-01"""
+    # For a time-only b this offset is exactly its time of day
+    return a + (b - _BASE_DATE)
+
+
+# (left type, right type) -> (result type, operation)
+_ADD_TABLE = {
+    (_DATETIME, _DURATION): (_DATETIME, operator.add),
+    (_DURATION, _DATETIME): (_DATETIME, operator.add),
+    (_DURATION, _DURATION): (_DURATION, operator.add),
+    (_DATETIME, _DATETIME): (_DATETIME, _add_datetimes),
+}
+_SUB_TABLE = {
+    (_DATETIME, _DATETIME): (_DURATION, operator.sub),
+    (_DATETIME, _DURATION): (_DATETIME, operator.sub),
+    (_DURATION, _DURATION): (_DURATION, operator.sub),
+}
+_MUL_TABLE = {
+    (_NUMBER, _DURATION): (_DURATION, operator.mul),
+    (_DURATION, _NUMBER): (_DURATION, operator.mul),
+}
+_OPERATOR_TABLES = {'+': _ADD_TABLE, '-': _SUB_TABLE, '*': _MUL_TABLE}
+_OPERATOR_ERRORS = {
+    '+': "Cannot add {a} and {b}",
+    '-': "Invalid subtraction",
+    '*': "Can only multiply number × duration",
+}
+
+
+@dataclass(slots=True)
+class DataRateResult:
+    """Outcome of a data transfer estimate (elapsed @ amount -> total)"""
+    total_time: timedelta
+    transfer_rate: float  # bytes per second
+    elapsed_time: timedelta
+    data_amount: float  # bytes
+    total_data: float  # bytes
+
+
+def _split_dhms(total_seconds):
+    """Split non-negative seconds into (days, hours, minutes, seconds)"""
+    whole = int(total_seconds)
+    days, rest = divmod(whole, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return days, hours, minutes, seconds + (total_seconds - whole)
+
+
+def _english_list(parts):
+    """Join ['a', 'b', 'c'] as 'a, b, and c' (or 'a and b', or 'a')"""
+    if len(parts) < 3:
+        return ' and '.join(parts)
+    return f"{', '.join(parts[:-1])}, and {parts[-1]}"
+
+
+# The same amounts and durations recur across the lines of one result (and
+# across recalculations), so their formatted forms are cached
+@functools.lru_cache(maxsize=256)
+def _format_data_amount(bytes_value):
+    """Format bytes into human-readable data amounts"""
+    if bytes_value == 0:
+        return "0 B"
+    if bytes_value < 1:
+        return f"{bytes_value} B"
+    
+    # Jump straight to the unit; log10 can round up just below a power of
+    # 1000, so step back one unit when that happens
+    k = min(len(_DATA_FORMAT_UNITS) - 1, int(math.log10(bytes_value)) // 3)
+    unit, factor = _DATA_FORMAT_UNITS[k]
+    if bytes_value < factor:
+        unit, factor = _DATA_FORMAT_UNITS[k - 1]
+    
+    value = bytes_value / factor
+    if value >= 100:
+        return f"{value:.0f} {unit}"
+    elif value >= 10:
+        return f"{value:.1f} {unit}"
+    else:
+        return f"{value:.2f} {unit}"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_friendly(duration):
+    """Format duration in friendly way"""
+    total_seconds = abs(duration.total_seconds())
+    
+    days, hours, minutes, seconds = _split_dhms(total_seconds)
+    
+    parts = []
+    if days > 0:
+        parts.append(f"{days} day{'s' if days != 1 else ''}")
+    if hours > 0:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes > 0:
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    if seconds > 0 or not parts:
+        whole_seconds = int(seconds)
+        if seconds == whole_seconds:
+            parts.append(f"{whole_seconds} second{'s' if whole_seconds != 1 else ''}")
+        else:
+            parts.append(f"{seconds:.1f} seconds")
+    
+    return _english_list(parts)
 
-try:
-    import pystray
-    from pystray import MenuItem as item
-    TRAY_AVAILABLE = PIL_AVAILABLE  # Tray needs PIL for icons
-except ImportError:
-    TRAY_AVAILABLE = False
+
+# Editing the duration side of an expression often leaves the resulting
+# datetime unchanged, so its whole section is cached
+@functools.lru_cache(maxsize=128)
+def _datetime_result_text(dt):
+    """Build the date/time section of the results"""
+    lines = ["📅 DATE/TIME RESULT\n", "-" * 50 + "\n\n"]
+    
+    # Format the shared numeric pieces once from the datetime's fields;
+    # only the weekday line needs strftime's locale names
+    year, month, day = dt.year, dt.month, dt.day
+    hour, minute, second, microsecond = dt.hour, dt.minute, dt.second, dt.microsecond
+    date_part = f"{year:04d}-{month:02d}-{day:02d}"
+    hms = f"{hour:02d}:{minute:02d}:{second:02d}"
+    time_part = f"{hms}.{microsecond // 1000:03d}"
+    clock_12 = f"{hour % 12 or 12:02d}:{minute:02d}:{second:02d} {'AM' if hour < 12 else 'PM'}"
+    # Same as dt.isoformat() for the naive datetimes the calculator produces
+    iso = f"{date_part}T{hms}.{microsecond:06d}" if microsecond else f"{date_part}T{hms}"
+    
+    formats = [
+        ("Standard", f"{date_part} {time_part}"),
+        ("ISO Format", iso),
+        ("12-Hour", f"{date_part} {clock_12}"),
+        ("US Format", f"{month:02d}/{day:02d}/{year:04d} {clock_12}"),
+        ("Date Only", date_part),
+        ("Time Only", time_part),
+        ("Weekday", dt.strftime("%A, %B %d, %Y")),
+        ("Unix Time", str(int(dt.timestamp()))),
+    ]
+    
+    lines.extend(f"{label:12}: {formatted}\n" for label, formatted in formats)
+    
+    return ''.join(lines)
+
+
+# Modern color scheme
+_COLORS = {
+    'primary': '#2c3e50',      # Dark blue-gray
+    'secondary': '#3498db',     # Blue
+    'accent': '#e74c3c',        # Red
+    'success': '#27ae60',        # Green
+    'warning': '#f39c12',       # Orange
+    'background': '#ecf0f1',    # Light gray
+    'surface': '#ffffff',       # White
+    'text': '#2c3e50',          # Dark text
+    'text_light': '#7f8c8d',    # Light text
+    'border': '#bdc3c7'         # Light border
+}
+
+# (style name, configure options, background state map) for every ttk style
+# the interface actually references; everything else uses the clam defaults
+_STYLE_SPEC = (
+    ('Title.TLabel',
+     {'font': ('Segoe UI', 20, 'bold'), 'foreground': _COLORS['primary']},
+     None),
+    ('Subtitle.TLabel',
+     {'font': ('Segoe UI', 10), 'foreground': _COLORS['text_light']},
+     None),
+    ('Primary.TButton',
+     {'font': ('Segoe UI', 10, 'bold'), 'foreground': 'white',
+      'background': _COLORS['secondary'], 'borderwidth': 0, 'focuscolor': 'none'},
+     [('active', '#2980b9'), ('pressed', '#21618c')]),
+    ('Secondary.TButton',
+     {'font': ('Segoe UI', 9), 'foreground': _COLORS['text'],
+      'background': _COLORS['surface'], 'borderwidth': 1, 'focuscolor': 'none'},
+     [('active', _COLORS['background']), ('pressed', _COLORS['border'])]),
+    ('Success.TButton',
+     {'font': ('Segoe UI', 9, 'bold'), 'foreground': 'white',
+      'background': _COLORS['success'], 'borderwidth': 0, 'focuscolor': 'none'},
+     [('active', '#229954'), ('pressed', '#1e8449')]),
+)
+
+# Static text for the results area and the help dialog, built once at import
+_WELCOME_TEXT = """🕐 Advanced Time Calculator
+
+✨ Features:
+✓ Multiple date/time formats (YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY)
+✓ Duration units with decimal precision (3.5h, 2.25d, 45.5s)
+✓ Compound durations (1d45m15s, 2h30m45s)
+✓ Current time with 'now' keyword
+✓ Scalar multiplication (3 * 2h 30m)
+✓ Flexible operations (3d + now, 45m * 2 + now)
+✓ Progress estimation (1h15s@15%, progress(2h30m, 35%))
+✓ AM/PM shorthand support (4:30p, 9:15a)
+✓ Data transfer rate calculations (2h30m @ 1.5GB -> 10GB)
+✓ System tray integration
+
+🚀 Quick Examples:
+• now + 30m
+• 2025-12-25 - now
+• 1h15s@15% (total time if 15% done in 1h15s)
+• progress(2h30m45s, 35%, remaining)
+• 4:30p + 1h
+• 3s + 4:30pm
+• 2h30m @ 1.5GB -> 10GB (data transfer estimation)"""
+
+_HELP_TEXT = """📖 ADVANCED TIME CALCULATOR - HELP
+
+🕐 TIME FORMATS:
+• 24-hour: 14:30, 14:30:45, 14:30:45.5
+• 12-hour: 2:30pm, 2:30:45pm, 4:30p, 9:15a
+• Current: now
+
+📅 DATE FORMATS:
+• ISO: 2025-08-19, 2025-08-19 14:30:45
+• US: 08/19/2025, 08/19/2025 2:30pm
+• International: 2025/08/19, 2025/08/19 16:51:00
+
+⏱️ DURATION UNITS:
+• y = years, mo = months, w = weeks, d = days
+• h = hours, m = minutes, s = seconds
+• Compound: 1h15s, 2h30m45s, 1d12h30m
+
+🧮 OPERATIONS:
+• now + 30m
+• 4:30pm + 3s
+• 3s + 4:30pm  
+• 2025-12-25 - now
+• 3d + now
+• 3 * 2h 30m
+
+📊 PROGRESS ESTIMATION:
+• 1h15s@15% (total time if 15% done)
+• progress(2h30m, 35%, remaining)
+• 15% in 1h15s
+
+⌨️ SHORTCUTS:
+• Enter: Calculate
+• Ctrl+L: Clear
+• F1: Help
+
+Examples of fixed issues:
+• 3s + 4:30pm ✓
+• 4:30pm + 3s ✓  
+• 4:30pm + 1h ✓
+• 9:15a + 2h ✓"""
 
 
 class AdvancedTimeCalculator:
@@ -33,13 +474,14 @@ class AdvancedTimeCalculator:
         self.root = root
         self.tray_icon = None
         self.is_hidden = False
+        self._calc_in_progress = False
         
         self.setup_window()
         self.create_icon()
         self.setup_styles()
+        self.setup_tray()  # Before the interface, which only offers the tray if it started
         self.create_interface()
         self.bind_shortcuts()
-        self.setup_tray()
 
     def setup_window(self):
         """Configure main window with optimized layout"""
@@ -57,58 +499,34 @@ class AdvancedTimeCalculator:
             pass  # Not supported on all systems
 
     def create_icon(self):
-        """Create application icon"""
-        if not PIL_AVAILABLE:
-            self.root.title("🕐 Advanced Time Calculator")
-            self.icon_image = None
+        """Load the embedded application icon"""
+        self.icon_image = None
+        try:
+            self.window_icon = tk.PhotoImage(data=_ICON_PNG_B64)
+            self.root.iconphoto(True, self.window_icon)
+        except tk.TclError:
+            self.window_icon = None  # Tk builds without PNG support
+        
+        # The tray needs a PIL image; PIL also covers a Tk that can't read PNG
+        if not PIL_AVAILABLE or (self.window_icon is not None and not TRAY_AVAILABLE):
             return
             
         try:
-            size = 64
-            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            # Clock face
-            margin = 4
-            draw.ellipse([margin, margin, size-margin, size-margin], 
-                        fill='#2c3e50', outline='#34495e', width=2)
-            
-            center = size // 2
-            
-            # Clock hands
-            draw.line([center, center, center + 12, center], fill='white', width=4)
-            draw.line([center, center, center, center - 16], fill='white', width=3)
-            
-            # Hour markers
-            for hour in range(12):
-                angle_rad = math.radians(hour * 30 - 90)
-                outer_x = center + 20 * math.cos(angle_rad)
-                outer_y = center + 20 * math.sin(angle_rad)
-                inner_x = center + 16 * math.cos(angle_rad)
-                inner_y = center + 16 * math.sin(angle_rad)
-                draw.line([inner_x, inner_y, outer_x, outer_y], fill='white', width=2)
-            
-            # Center dot
-            draw.ellipse([center-3, center-3, center+3, center+3], fill='white')
-            
-            # Calculator symbol
-            calc_x, calc_y = size - 16, size - 16
-            draw.rectangle([calc_x, calc_y, calc_x + 12, calc_y + 12], 
-                          fill='#3498db', outline='#2980b9')
-            plus_x, plus_y = calc_x + 6, calc_y + 6
-            draw.line([plus_x - 3, plus_y, plus_x + 3, plus_y], fill='white', width=2)
-            draw.line([plus_x, plus_y - 3, plus_x, plus_y + 3], fill='white', width=2)
+            from PIL import Image
             
-            # Set window icon
-            if IMAGETK_AVAILABLE:
-                self.window_icon = ImageTk.PhotoImage(image)
-                self.root.iconphoto(True, self.window_icon)
+            self.icon_image = Image.open(io.BytesIO(base64.b64decode(_ICON_PNG_B64)))
             
-            self.icon_image = image
+            if self.window_icon is None:
+                try:
+                    from PIL import ImageTk
+                except ImportError:
+                    pass  # Pillow built without Tk support; keep the tray image
+                else:
+                    self.window_icon = ImageTk.PhotoImage(self.icon_image)
+                    self.root.iconphoto(True, self.window_icon)
             
         except Exception as e:
             print(f"Icon creation failed: {e}")
-            self.root.title("🕐 Advanced Time Calculator")
             self.icon_image = None
 
     def setup_styles(self):
@@ -116,79 +534,12 @@ class AdvancedTimeCalculator:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
-        # Define modern color scheme
-        self.colors = {
-            'primary': '#2c3e50',      # Dark blue-gray
-            'secondary': '#3498db',     # Blue
-            'accent': '#e74c3c',        # Red
-            'success': '#27ae60',        # Green
-            'warning': '#f39c12',       # Orange
-            'background': '#ecf0f1',    # Light gray
-            'surface': '#ffffff',       # White
-            'text': '#2c3e50',          # Dark text
-            'text_light': '#7f8c8d',    # Light text
-            'border': '#bdc3c7'         # Light border
-        }
-        
-        # Configure modern styles
-        self.style.configure('Title.TLabel', 
-                           font=('Segoe UI', 20, 'bold'),
-                           foreground=self.colors['primary'])
-        
-        self.style.configure('Subtitle.TLabel',
-                           font=('Segoe UI', 10),
-                           foreground=self.colors['text_light'])
-        
-        self.style.configure('Modern.TLabelFrame',
-                           background=self.colors['surface'],
-                           borderwidth=1,
-                           relief='solid')
-        
-        self.style.configure('Modern.TLabelFrame.Label',
-                           font=('Segoe UI', 11, 'bold'),
-                           foreground=self.colors['primary'],
-                           background=self.colors['surface'])
-        
-        self.style.configure('Primary.TButton',
-                           font=('Segoe UI', 10, 'bold'),
-                           foreground='white',
-                           background=self.colors['secondary'],
-                           borderwidth=0,
-                           focuscolor='none')
-        
-        self.style.map('Primary.TButton',
-                      background=[('active', '#2980b9'),
-                                 ('pressed', '#21618c')])
-        
-        self.style.configure('Secondary.TButton',
-                           font=('Segoe UI', 9),
-                           foreground=self.colors['text'],
-                           background=self.colors['surface'],
-                           borderwidth=1,
-                           focuscolor='none')
+        self.colors = _COLORS
         
-        self.style.map('Secondary.TButton',
-                      background=[('active', self.colors['background']),
-                                 ('pressed', self.colors['border'])])
-        
-        self.style.configure('Success.TButton',
-                           font=('Segoe UI', 9, 'bold'),
-                           foreground='white',
-                           background=self.colors['success'],
-                           borderwidth=0,
-                           focuscolor='none')
-        
-        self.style.map('Success.TButton',
-                      background=[('active', '#229954'),
-                                 ('pressed', '#1e8449')])
-        
-        # Configure status bar
-        self.style.configure('Status.TLabel',
-                           font=('Segoe UI', 9),
-                           foreground=self.colors['text_light'],
-                           background=self.colors['border'],
-                           relief='sunken',
-                           borderwidth=1)
+        for name, options, state_map in _STYLE_SPEC:
+            self.style.configure(name, **options)
+            if state_map:
+                self.style.map(name, background=state_map)
 
     def create_interface(self):
         """Create modern interface"""
@@ -279,8 +630,8 @@ class AdvancedTimeCalculator:
                              command=self.show_help, style='Secondary.TButton')
         help_btn.pack(side=tk.LEFT, padx=(0, 12))
         
-        # Tray button if available
-        if TRAY_AVAILABLE:
+        # Tray button if the tray icon started
+        if self.tray_icon:
             tray_btn = ttk.Button(buttons, text="📌 Minimize to Tray", 
                                  command=self.hide_window, style='Success.TButton')
             tray_btn.pack(side=tk.LEFT)
@@ -326,9 +677,10 @@ class AdvancedTimeCalculator:
 
     def bind_shortcuts(self):
         """Bind keyboard shortcuts"""
-        self.root.bind('<Return>', lambda e: self.calculate())
+        # Enter in the input box calculates; 'break' stops the Text widget from
+        # inserting a newline and the event from also reaching the root binding
+        self.input_text.bind('<Return>', self.on_return)
         self.root.bind('<Control-Return>', lambda e: self.calculate())
-        self.input_text.bind('<Return>', lambda e: self.calculate())
         self.root.bind('<F1>', lambda e: self.show_help())
         self.root.bind('<Control-l>', lambda e: self.clear_input())
         self.root.bind('<Control-h>', lambda e: self.toggle_window())
@@ -339,6 +691,9 @@ class AdvancedTimeCalculator:
             return
             
         try:
+            import pystray
+            from pystray import MenuItem as item
+            
             menu = pystray.Menu(
                 item('Open Calculator', self.show_window),
                 item('Quick Calculate', self.quick_calculate),
@@ -360,7 +715,7 @@ class AdvancedTimeCalculator:
 
     # Window management
     def on_closing(self):
-        if TRAY_AVAILABLE and self.tray_icon:
+        if self.tray_icon:
             self.hide_window()
         else:
             self.quit_application()
@@ -386,7 +741,7 @@ class AdvancedTimeCalculator:
 
     # Tray functions
     def quick_calculate(self):
-        if not TRAY_AVAILABLE:
+        if not self.tray_icon:
             return
             
         dialog = tk.Toplevel()
@@ -425,7 +780,7 @@ class AdvancedTimeCalculator:
         entry.bind('<Return>', lambda e: calc())
 
     def show_current_time(self):
-        if TRAY_AVAILABLE:
+        if self.tray_icon:
             try:
                 self.tray_icon.notify("Current Time", 
                                      datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 
@@ -443,17 +798,28 @@ class AdvancedTimeCalculator:
         self.input_text.delete('1.0', tk.END)
         self.input_text.focus_set()
 
+    def on_return(self, event):
+        self.calculate()
+        return 'break'
+
     def calculate(self):
         """Main calculation function"""
+        # Ignore repeated Enter presses while a calculation (or its error
+        # dialog, which runs a nested event loop) is still on screen
+        if self._calc_in_progress:
+            return
+        self._calc_in_progress = True
+        
         try:
-            expression = self.input_text.get('1.0', tk.END).strip()
+            # An empty widget is answered from its end index alone; only
+            # non-empty input is copied out (without Tk's trailing newline)
+            expression = ''
+            if self.input_text.index('end-1c') != '1.0':
+                expression = self.input_text.get('1.0', 'end-1c').strip()
             if not expression:
                 self.status_var.set("⚠️ Please enter a calculation")
                 return
 
-            self.status_var.set("🔄 Calculating...")
-            self.root.update()
-
             result = self.parse_and_calculate(expression)
             self.display_results(expression, result)
             self.status_var.set("✅ Calculation completed")
@@ -462,20 +828,22 @@ class AdvancedTimeCalculator:
             self.status_var.set(f"❌ Error: {str(e)}")
             messagebox.showerror("Calculation Error", 
                                f"Unable to process:\n\n{str(e)}\n\nPlease check input format.")
+        finally:
+            self._calc_in_progress = False
 
     # Core parsing and calculation
-    def parse_and_calculate(self, expression):
+    def parse_and_calculate(self, expression, now=None):
         """Main calculation engine"""
+        # Capture the current time once so every 'now' in the expression and
+        # every ETA agrees.  Whole seconds, as 'now' has always been shown.
+        if now is None:
+            now = datetime.now().replace(microsecond=0)
+
         # Clean expression
         expression = expression.replace('\n', ' ').replace('\r', '').strip()
 
-        # Replace 'now' with current timestamp
-        if 'now' in expression.lower():
-            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            expression = re.sub(r'\bnow\b', now_str, expression, flags=re.IGNORECASE)
-
         # Check for rate calculation syntax: time @ data -> total_data
-        rate_match = re.match(r'^(.+?)\s*@\s*(.+?)\s*->\s*(.+?)$', expression.strip())
+        rate_match = _RATE_RE.match(expression.strip())
         if rate_match:
             return self.calculate_data_rate(rate_match.group(1), rate_match.group(2), rate_match.group(3))
 
@@ -484,68 +852,66 @@ class AdvancedTimeCalculator:
 
         # Check if this is a progress function
         if self.is_progress_function(expression):
-            return self.calculate_progress(expression)
+            return self.calculate_progress(expression, now)
 
         # Tokenize for arithmetic operations
         tokens = self.tokenize(expression)
 
         if len(tokens) < 3:
             if len(tokens) == 1 and self.is_progress_function(tokens[0]):
-                return self.calculate_progress(tokens[0])
+                return self.calculate_progress(tokens[0], now)
             raise ValueError("Expression must contain at least one operator")
 
         # Process the calculation
-        return self.evaluate_tokens(tokens)
+        return self.evaluate_tokens(tokens, now)
 
     def convert_progress_syntax(self, expression):
         """Convert @ and 'in' syntax to progress functions"""
-        # Pattern for compound durations: 1h15s, 2d30m45s, etc.
-        duration_pattern = r'[0-9]+(?:\.[0-9]+)?[a-zA-Z]+(?:[0-9]+(?:\.[0-9]+)?[a-zA-Z]+)*'
-        
         # Convert @ syntax: "1h15s@15%" -> "progress(1h15s, 15%)"
-        at_pattern = r'({duration_pattern})\s*@\s*([0-9]+(?:\.[0-9]+)?)%'
-        expression = re.sub(at_pattern, r'progress(\1, \2%)', expression)
+        expression = _AT_PROGRESS_RE.sub(r'progress(\1, \2%)', expression)
         
         # Convert "% in" syntax: "15% in 1h15s" -> "progress(1h15s, 15%)"
-        in_pattern = r'([0-9]+(?:\.[0-9]+)?)%\s+in\s+({duration_pattern})'
-        expression = re.sub(in_pattern, r'progress(\2, \1%)', expression)
+        expression = _IN_PROGRESS_RE.sub(r'progress(\2, \1%)', expression)
         
         return expression
 
     def is_progress_function(self, text):
         """Check if text is a progress function call"""
-        return re.match(r'^\s*progress\s*\([^)]+\)\s*$', text, re.IGNORECASE) is not None
+        return _PROGRESS_FN_RE.match(text) is not None
 
-    def calculate_progress(self, progress_expr):
+    def calculate_progress(self, progress_expr, now=None):
         """Calculate progress estimates"""
         # Parse: progress(duration, percentage[, mode])
-        pattern = r'progress\s*\(\s*([^,]+)\s*,\s*([0-9]+(?:\.[0-9]+)?)%(?:\s*,\s*(\w+))?\s*\)'
-        match = re.match(pattern, progress_expr, re.IGNORECASE)
+        match = _PROGRESS_PARSE_RE.match(progress_expr)
         
         if not match:
             raise ValueError("Invalid progress syntax")
         
         duration_str = match.group(1).strip()
-        percentage = float(match.group(2))
         mode = (match.group(3) or 'total').lower()
         
-        if not (0 < percentage < 100):
+        # Work in integer microseconds and the percentage's own decimal digits
+        # (12.5% is 125 / 1000 of 100) so results are exact and repeatable
+        whole, _, fraction = match.group(2).partition('.')
+        percent_units = int(whole + fraction)
+        hundred_percent = 100 * 10 ** len(fraction)
+        if not (0 < percent_units < hundred_percent):
             raise ValueError("Percentage must be between 0 and 100")
         
         # Parse elapsed duration
         elapsed = self.parse_duration(duration_str)
-        elapsed_seconds = elapsed.total_seconds()
+        elapsed_us = (elapsed.days * 86_400 + elapsed.seconds) * 1_000_000 + elapsed.microseconds
         
-        # Calculate total and remaining
-        total_seconds = elapsed_seconds / (percentage / 100.0)
-        remaining_seconds = total_seconds - elapsed_seconds
+        # Calculate total and remaining (rounded to the nearest microsecond)
+        total_us = (elapsed_us * hundred_percent + percent_units // 2) // percent_units
+        remaining_us = total_us - elapsed_us
         
         if mode == 'total':
-            return timedelta(seconds=total_seconds)
+            return timedelta(microseconds=total_us)
         elif mode == 'remaining':
-            return timedelta(seconds=remaining_seconds)
+            return timedelta(microseconds=remaining_us)
         elif mode == 'eta':
-            return datetime.now() + timedelta(seconds=remaining_seconds)
+            return (now or datetime.now()) + timedelta(microseconds=remaining_us)
         else:
             raise ValueError(f"Invalid mode: {mode}")
 
@@ -554,331 +920,122 @@ class AdvancedTimeCalculator:
         # Don't tokenize function calls
         if self.is_progress_function(expression):
             return [expression]
-            
-        tokens = []
-        current = ""
-        paren_depth = 0
         
-        for char in expression:
-            if char == '(':
-                paren_depth += 1
-                current += char
-            elif char == ')':
-                paren_depth -= 1
-                current += char
-            elif char in '+-*' and paren_depth == 0:
-                if self.is_operator_here(expression, current, char):
-                    if current.strip():
-                        tokens.append(current.strip())
-                    tokens.append(char)
-                    current = ""
+        # Dates, times and durations are matched as whole tokens, so the
+        # '-' inside 2025-08-19 is never mistaken for an operator
+        tokens = []
+        sign = None
+        for match in _TOKEN_RE.finditer(expression):
+            kind, text = match.lastgroup, match.group().strip()
+            
+            # A + or - at the start or right after another operator is the
+            # sign of the number or duration that follows (-1h, 1h - -30m)
+            if (sign is None and kind == 'op' and text != '*'
+                    and (not tokens or tokens[-1] in _OPERATORS)):
+                sign = text
+                continue
+            if sign is not None:
+                if kind in ('num', 'dur'):
+                    text = sign + text
                 else:
-                    current += char
-            else:
-                current += char
-        
-        if current.strip():
-            tokens.append(current.strip())
+                    tokens.append(sign)
+                sign = None
+            tokens.append(text)
         
+        if sign is not None:
+            tokens.append(sign)
         return tokens
 
-    def is_operator_here(self, expression, before, char):
-        """Determine if character is an operator in context"""
-        if not before.strip():
-            return False
-        
-        # Don't split dates like 2025-08-19
-        if char == '-':
-            if re.search(r'\d{4}$', before) or re.search(r'\d{4}-\d{2}$', before):
-                return False
-        
-        # Multiplication is always an operator
-        if char == '*':
-            return True
-            
-        # Check for datetime patterns
-        if self.looks_like_datetime(before.strip()):
-            return True
-            
-        # Look for surrounding whitespace
-        return ' ' in before or expression.find(before + char + ' ') != -1
-
-    def looks_like_datetime(self, text):
-        """Enhanced datetime pattern detection"""
-        patterns = [
-            r'^\d{4}[-/]\d{2}[-/]\d{2}(\s+\d{1,2}:\d{2}(:\d{2})?(\s*[ap]m?)?)?$',
-            r'^\d{1,2}/\d{1,2}/\d{4}(\s+\d{1,2}:\d{2}(:\d{2})?(\s*[ap]m?)?)?$',
-            r'^\d{1,2}:\d{2}(:\d{2})?(\s*[ap]m?)?$',  # Include 'a'/'p' support
-        ]
-        return any(re.match(p, text, re.IGNORECASE) for p in patterns)
-
-    def evaluate_tokens(self, tokens):
+    def evaluate_tokens(self, tokens, now=None):
         """Evaluate tokenized expression"""
+        # Operands and operators must alternate: a op b op c ...
+        for i, token in enumerate(tokens):
+            is_operator = token in _OPERATORS
+            if i % 2 == 0 and is_operator:
+                raise ValueError(f"Expected a value, found operator '{token}'")
+            if i % 2 == 1 and not is_operator:
+                raise ValueError(f"Missing operator between '{tokens[i - 1]}' and '{token}'")
+        if len(tokens) % 2 == 0:
+            raise ValueError(f"Expression ends with operator '{tokens[-1]}'")
+        
         # Parse first token
-        if self.is_number(tokens[0]) and len(tokens) >= 3 and tokens[1] == '*':
-            result = float(tokens[0])
+        if _NUMBER_RE.match(tokens[0]) and len(tokens) >= 3 and tokens[1] == '*':
+            result_type, result = _NUMBER, float(tokens[0])
         else:
-            first = self.parse_value(tokens[0])
-            # Handle duration + datetime pattern
-            if isinstance(first, timedelta) and len(tokens) >= 3 and tokens[1] == '+':
-                second = self.parse_value(tokens[2])
-                if isinstance(second, datetime):
-                    return second + first
-            result = first
+            result_type, result = self.parse_value_typed(tokens[0], now)
 
         # Process operations
         i = 1
         while i < len(tokens) - 1:
             op = tokens[i]
-            operand = self.parse_value(tokens[i + 1])
+            operand_type, operand = self.parse_value_typed(tokens[i + 1], now)
             
-            if op == '+':
-                result = self.add_values(result, operand)
-            elif op == '-':
-                result = self.subtract_values(result, operand)
-            elif op == '*':
-                result = self.multiply_values(result, operand)
-            else:
+            table = _OPERATOR_TABLES.get(op)
+            if table is None:
                 raise ValueError(f"Unknown operator: {op}")
             
+            entry = table.get((result_type, operand_type))
+            if entry is None:
+                raise ValueError(_OPERATOR_ERRORS[op].format(
+                    a=type(result).__name__, b=type(operand).__name__))
+            
+            result_type, operation = entry
+            result = operation(result, operand)
             i += 2
         
         return result
 
-    def add_values(self, a, b):
-        """Add two values with enhanced type checking"""
-        if isinstance(a, datetime) and isinstance(b, timedelta):
-            return a + b
-        elif isinstance(a, timedelta) and isinstance(b, datetime):
-            return b + a
-        elif isinstance(a, timedelta) and isinstance(b, timedelta):
-            return a + b
-        elif isinstance(a, datetime) and isinstance(b, datetime):
-            # Handle time-only additions - check if b is time-only
-            if b.date() == datetime(1900, 1, 1).date():
-                # b is time-only, add its time components to a
-                return a + timedelta(hours=b.hour, minutes=b.minute, 
-                                   seconds=b.second, microseconds=b.microsecond)
-            else:
-                # Both are full datetimes, add b's offset from epoch
-                return a + (b - datetime(1900, 1, 1))
-        else:
-            raise ValueError(f"Cannot add {type(a).__name__} and {type(b).__name__}")
-
-    def subtract_values(self, a, b):
-        """Subtract two values with type checking"""
-        if isinstance(a, datetime) and isinstance(b, datetime):
-            return a - b
-        elif isinstance(a, datetime) and isinstance(b, timedelta):
-            return a - b
-        elif isinstance(a, timedelta) and isinstance(b, timedelta):
-            return a - b
-        else:
-            raise ValueError("Invalid subtraction")
-
-    def multiply_values(self, a, b):
-        """Multiply values with type checking"""
-        if isinstance(a, (int, float)) and isinstance(b, timedelta):
-            return b * a
-        elif isinstance(a, timedelta) and isinstance(b, (int, float)):
-            return a * b
-        else:
-            raise ValueError("Can only multiply number × duration")
-
-    def parse_value(self, text):
-        """Parse a single value (datetime, duration, or number)"""
+    def parse_value_typed(self, text, now=None):
+        """Parse a single value, returning (type code, value)"""
+        # Called once per operand, so the checks below go straight to the
+        # module-level patterns and parsers instead of through methods
         text = text.strip()
         
         if text.lower() == 'now':
-            return datetime.now()
-        
-        if self.is_number(text):
-            return float(text)
-            
-        if self.is_datetime_format(text):
-            return self.parse_datetime(text)
-        else:
-            return self.parse_duration(text)
-
-    def is_number(self, text):
-        """Check if text is a number"""
-        try:
-            float(text)
-            return True
-        except ValueError:
-            return False
-
-    def is_datetime_format(self, text):
-        """Enhanced datetime format detection"""
-        # Check for time patterns (including AM/PM variations)
-        time_patterns = [
-            r'\d{1,2}:\d{2}(:\d{2})?(\.\d+)?(\s*[ap]m?)?',  # Support both 'a'/'p' and 'am'/'pm'
-            r'\d{4}[-/]\d{2}[-/]\d{2}',  # Date patterns
-            r'\d{1,2}/\d{1,2}/\d{4}',    # US date format
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in time_patterns)
-
-    def parse_datetime(self, time_str):
-        """Enhanced datetime parsing with 'a'/'p' support"""
-        time_str = time_str.strip()
-        
-        # Normalize 'a' and 'p' to 'am' and 'pm' before parsing
-        time_str = re.sub(r'([ap])(?:\s|$)', r'\1m', time_str, flags=re.IGNORECASE)
-        
-        formats = [
-            "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M",
-            "%Y-%m-%d %I:%M:%S %p", "%Y-%m-%d %I:%M %p",
-            "%Y/%m/%d %H:%M:%S.%f", "%Y/%m/%d %H:%M:%S", "%Y/%m/%d %H:%M",
-            "%Y/%m/%d %I:%M:%S %p", "%Y/%m/%d %I:%M %p",
-            "%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%m/%d/%Y %I:%M %p",
-            "%H:%M:%S.%f", "%H:%M:%S", "%H:%M", "%I:%M:%S %p", "%I:%M %p",
-            "%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y"
-        ]
+            return _DATETIME, now or datetime.now()
         
-        for fmt in formats:
-            try:
-                return datetime.strptime(time_str, fmt)
-            except ValueError:
-                continue
-        
-        # Enhanced decimal seconds handling with 'a'/'p' support
-        decimal_patterns = [
-            r'^(\d{1,2}):(\d{2}):(\d{1,2}(?:\.\d+)?)(?:\s*(am|pm))?$',
-            r'^(\d{1,2}):(\d{2})(?:\s*(am|pm))?$',  # Handle minutes-only times
-        ]
+        # progress(...) used as one operand of a larger expression
+        if _PROGRESS_FN_RE.match(text):
+            value = self.calculate_progress(text, now)
+            return (_DURATION if isinstance(value, timedelta) else _DATETIME), value
         
-        for pattern in decimal_patterns:
-            match = re.match(pattern, time_str, re.IGNORECASE)
-            if match:
-                hours = int(match.group(1))
-                minutes = int(match.group(2))
-                
-                # Handle seconds (may not be present)
-                if len(match.groups()) >= 4 and match.group(3):  # Pattern with seconds
-                    seconds_float = float(match.group(3))
-                    ampm = match.group(4) if match.group(4) else None
-                else:  # Pattern without seconds
-                    seconds_float = 0.0
-                    ampm = match.group(3) if len(match.groups()) >= 3 and match.group(3) else None
-                
-                # Validate components
-                if minutes >= 60 or seconds_float >= 60:
-                    raise ValueError(f"Invalid time: {minutes}m {seconds_float}s")
-                
-                # Handle AM/PM
-                if ampm:
-                    if not (1 <= hours <= 12):
-                        raise ValueError(f"Invalid 12-hour format: {hours}")
-                    if ampm.lower() in ['pm', 'p'] and hours != 12:
-                        hours += 12
-                    elif ampm.lower() in ['am', 'a'] and hours == 12:
-                        hours = 0
-                elif hours >= 24:
-                    raise ValueError(f"Invalid 24-hour format: {hours}")
-                
-                seconds = int(seconds_float)
-                microseconds = int((seconds_float - seconds) * 1000000)
-                return datetime(1900, 1, 1, hours, minutes, seconds, microseconds)
-        
-        raise ValueError(f"Cannot parse datetime: {time_str}")
+        if _NUMBER_RE.match(text):
+            return _NUMBER, float(text)
+            
+        value = _parse_datetime(text)
+        if value is not None:
+            return _DATETIME, value
+        return _DURATION, _parse_duration(text)
 
     def parse_duration(self, duration_str):
         """Parse duration strings including compound formats like 1h15s"""
-        duration_str = duration_str.strip().lower()
-        
-        # Simple decimal hours
-        if re.match(r'^[0-9]+(?:\.[0-9]+)?h$', duration_str):
-            return timedelta(hours=float(duration_str[:-1]))
-        
-        # Parse compound durations
-        total = timedelta()
-        
-        # Find all time components
-        patterns = {
-            r'([0-9]+(?:\.[0-9]+)?)y': lambda x: timedelta(days=float(x) * 365.25),
-            r'([0-9]+(?:\.[0-9]+)?)mo': lambda x: timedelta(days=float(x) * 30.44),
-            r'([0-9]+(?:\.[0-9]+)?)w': lambda x: timedelta(weeks=float(x)),
-            r'([0-9]+(?:\.[0-9]+)?)d': lambda x: timedelta(days=float(x)),
-            r'([0-9]+(?:\.[0-9]+)?)h': lambda x: timedelta(hours=float(x)),
-            r'([0-9]+(?:\.[0-9]+)?)m(?!o)': lambda x: timedelta(minutes=float(x)),
-            r'([0-9]+(?:\.[0-9]+)?)s': lambda x: timedelta(seconds=float(x))
-        }
-        
-        found_any = False
-        for pattern, converter in patterns.items():
-            matches = re.findall(pattern, duration_str)
-            for match in matches:
-                total += converter(match)
-                found_any = True
-        
-        if not found_any:
-            raise ValueError(f"Cannot parse duration: {duration_str}")
-        
-        return total
+        return _parse_duration(duration_str)
 
     def parse_data_amount(self, data_str):
         """Parse data amounts with various units (KB, MB, GB, TB, KiB, MiB, GiB, TiB)"""
         data_str = data_str.strip()
         
-        # Pattern to match number + unit
-        pattern = r'^([0-9]+(?:\.[0-9]+)?)\s*([KMGTP]?[i]?[B])$'
-        match = re.match(pattern, data_str, re.IGNORECASE)
+        # Split off the unit suffix (GB, MiB, ...) without a regex
+        number = data_str.rstrip(_DATA_UNIT_LETTERS)
+        unit = data_str[len(number):].upper()
+        number = number.rstrip()
         
-        if not match:
+        # ASCII digits with an optional inner point, like [0-9]+(\.[0-9]+)?;
+        # isdecimal() alone would also take '.5', '5.' and non-ASCII digits
+        whole, point, fraction = number.partition('.')
+        if (not unit or not number.isascii() or not whole.isdecimal()
+                or (point and not fraction.isdecimal())):
             raise ValueError(f"Cannot parse data amount: {data_str}")
         
-        value = float(match.group(1))
-        unit = match.group(2).upper()
-        
-        # Define conversion factors (to bytes)
-        factors = {
-            # Decimal units (1000-based)
-            'B': 1,
-            'KB': 1000,
-            'MB': 1000**2,
-            'GB': 1000**3,
-            'TB': 1000**4,
-            'PB': 1000**5,
-            # Binary units (1024-based)
-            'KIB': 1024,
-            'MIB': 1024**2,
-            'GIB': 1024**3,
-            'TIB': 1024**4,
-            'PIB': 1024**5,
-        }
-        
-        if unit not in factors:
+        factor = _DATA_FACTORS.get(unit)
+        if factor is None:
             raise ValueError(f"Unknown data unit: {unit}")
         
-        return value * factors[unit]
+        return float(number) * factor
 
     def format_data_amount(self, bytes_value):
         """Format bytes into human-readable data amounts"""
-        if bytes_value == 0:
-            return "0 B"
-        
-        # Define units and their factors
-        units = [
-            ('PB', 1000**5),
-            ('TB', 1000**4),
-            ('GB', 1000**3),
-            ('MB', 1000**2),
-            ('KB', 1000),
-            ('B', 1)
-        ]
-        
-        for unit, factor in units:
-            if bytes_value >= factor:
-                value = bytes_value / factor
-                if value >= 100:
-                    return f"{value:.0f} {unit}"
-                elif value >= 10:
-                    return f"{value:.1f} {unit}"
-                else:
-                    return f"{value:.2f} {unit}"
-        
-        return f"{bytes_value} B"
+        return _format_data_amount(bytes_value)
 
     def format_data_rate(self, bytes_per_second):
         """Format data transfer rate"""
@@ -917,14 +1074,8 @@ class AdvancedTimeCalculator:
             total_time = timedelta(seconds=total_time_seconds)
             
             # Return a special result object that includes rate information
-            return {
-                'type': 'data_rate',
-                'total_time': total_time,
-                'transfer_rate': transfer_rate,
-                'elapsed_time': elapsed_time,
-                'data_amount': data_amount_bytes,
-                'total_data': total_data_bytes
-            }
+            return DataRateResult(total_time, transfer_rate, elapsed_time,
+                                  data_amount_bytes, total_data_bytes)
             
         except Exception as e:
             raise ValueError(f"Data rate calculation error: {str(e)}")
@@ -934,245 +1085,139 @@ class AdvancedTimeCalculator:
         """Show welcome message"""
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete('1.0', tk.END)
-        
-        welcome = """🕐 Advanced Time Calculator
-
-✨ Features:
-✓ Multiple date/time formats (YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY)
-✓ Duration units with decimal precision (3.5h, 2.25d, 45.5s)
-✓ Compound durations (1d45m15s, 2h30m45s)
-✓ Current time with 'now' keyword
-✓ Scalar multiplication (3 * 2h 30m)
-✓ Flexible operations (3d + now, 45m * 2 + now)
-✓ Progress estimation (1h15s@15%, progress(2h30m, 35%))
-✓ AM/PM shorthand support (4:30p, 9:15a)
-✓ Data transfer rate calculations (2h30m @ 1.5GB -> 10GB)
-✓ System tray integration
-
-🚀 Quick Examples:
-• now + 30m
-• 2025-12-25 - now
-• 1h15s@15% (total time if 15% done in 1h15s)
-• progress(2h30m45s, 35%, remaining)
-• 4:30p + 1h
-• 3s + 4:30pm
-• 2h30m @ 1.5GB -> 10GB (data transfer estimation)"""
-
-        self.results_text.insert(tk.END, welcome)
+        self.results_text.insert(tk.END, _WELCOME_TEXT)
         self.results_text.config(state=tk.DISABLED)
 
     def display_results(self, expression, result):
         """Display results"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete('1.0', tk.END)
-        
-        # Header
-        self.results_text.insert(tk.END, "=" * 69 + "\n")
-        self.results_text.insert(tk.END, f"CALCULATION: {expression}\n")
-        self.results_text.insert(tk.END, "=" * 69 + "\n\n")
+        # Build the whole report first so the Text widget is updated (and laid
+        # out) once instead of once per line
+        parts = [
+            "=" * 69 + "\n",
+            f"CALCULATION: {expression}\n",
+            "=" * 69 + "\n\n",
+        ]
         
-        if isinstance(result, dict) and result.get('type') == 'data_rate':
-            self.display_data_rate_result(result, expression)
+        if isinstance(result, DataRateResult):
+            parts.append(self.display_data_rate_result(result, expression))
         elif isinstance(result, timedelta):
-            self.display_duration_result(result, expression)
+            parts.append(self.display_duration_result(result, expression))
         else:
-            self.display_datetime_result(result)
+            parts.append(self.display_datetime_result(result))
+        
+        parts.append("\n" + "=" * 69)
         
-        self.results_text.insert(tk.END, "\n" + "=" * 69)
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete('1.0', tk.END)
+        self.results_text.insert(tk.END, ''.join(parts))
         self.results_text.config(state=tk.DISABLED)
         self.results_text.see('1.0')
 
     def display_data_rate_result(self, result, expression):
-        """Display data transfer rate calculation results"""
-        self.results_text.insert(tk.END, "📊 DATA TRANSFER CALCULATION\n")
-        self.results_text.insert(tk.END, "-" * 50 + "\n\n")
+        """Build the data transfer rate section of the results"""
+        lines = ["📊 DATA TRANSFER CALCULATION\n", "-" * 50 + "\n\n"]
         
         # Extract data from result
-        total_time = result['total_time']
-        transfer_rate = result['transfer_rate']
-        elapsed_time = result['elapsed_time']
-        data_amount = result['data_amount']
-        total_data = result['total_data']
+        total_time = result.total_time
+        transfer_rate = result.transfer_rate
+        elapsed_time = result.elapsed_time
+        data_amount = result.data_amount
+        total_data = result.total_data
         
         # Display total time needed
         total_seconds = total_time.total_seconds()
-        days = int(total_seconds // 86400)
-        hours = int((total_seconds % 86400) // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = total_seconds % 60
+        days, hours, minutes, seconds = _split_dhms(total_seconds)
         
-        self.results_text.insert(tk.END, f"⏱️  Total Time Needed: {days}d {hours}h {minutes}m {seconds:.1f}s\n")
-        self.results_text.insert(tk.END, f"📈 Transfer Rate: {self.format_data_rate(transfer_rate)}\n\n")
+        lines.append(f"⏱️  Total Time Needed: {days}d {hours}h {minutes}m {seconds:.1f}s\n")
+        lines.append(f"📈 Transfer Rate: {self.format_data_rate(transfer_rate)}\n\n")
         
         # Display calculation details
-        self.results_text.insert(tk.END, "📋 Calculation Details:\n")
-        self.results_text.insert(tk.END, "-" * 30 + "\n")
-        self.results_text.insert(tk.END, f"Elapsed Time: {self.format_friendly(elapsed_time)}\n")
-        self.results_text.insert(tk.END, f"Data Transferred: {self.format_data_amount(data_amount)}\n")
-        self.results_text.insert(tk.END, f"Total Data Needed: {self.format_data_amount(total_data)}\n\n")
+        lines.append("📋 Calculation Details:\n")
+        lines.append("-" * 30 + "\n")
+        lines.append(f"Elapsed Time: {self.format_friendly(elapsed_time)}\n")
+        lines.append(f"Data Transferred: {self.format_data_amount(data_amount)}\n")
+        lines.append(f"Total Data Needed: {self.format_data_amount(total_data)}\n\n")
         
         # Progress analysis
         progress_pct = (data_amount / total_data) * 100
         remaining_pct = 100 - progress_pct
         remaining_data = total_data - data_amount
         
-        self.results_text.insert(tk.END, "📊 Progress Analysis:\n")
-        self.results_text.insert(tk.END, "-" * 30 + "\n")
-        self.results_text.insert(tk.END, f"Progress: {progress_pct:.1f}% complete\n")
-        self.results_text.insert(tk.END, f"Remaining: {self.format_data_amount(remaining_data)} ({remaining_pct:.1f}%)\n")
-        self.results_text.insert(tk.END, f"Time Remaining: {self.format_friendly(total_time)}\n\n")
+        lines.append("📊 Progress Analysis:\n")
+        lines.append("-" * 30 + "\n")
+        lines.append(f"Progress: {progress_pct:.1f}% complete\n")
+        lines.append(f"Remaining: {self.format_data_amount(remaining_data)} ({remaining_pct:.1f}%)\n")
+        lines.append(f"Time Remaining: {self.format_friendly(total_time)}\n\n")
         
         # ETA calculation
         eta = datetime.now() + total_time
-        self.results_text.insert(tk.END, f"🎯 Estimated Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        lines.append(f"🎯 Estimated Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+        return ''.join(lines)
 
     def display_duration_result(self, duration, expression):
-        """Display duration with progress analysis"""
-        self.results_text.insert(tk.END, "⏱️  DURATION RESULT\n")
-        self.results_text.insert(tk.END, "-" * 50 + "\n\n")
+        """Build the duration section of the results, with progress analysis"""
+        lines = ["⏱️  DURATION RESULT\n", "-" * 50 + "\n\n"]
         
         total_seconds = duration.total_seconds()
         abs_seconds = abs(total_seconds)
         
-        days = int(abs_seconds // 86400)
-        hours = int((abs_seconds % 86400) // 3600)
-        minutes = int((abs_seconds % 3600) // 60)
-        seconds = abs_seconds % 60
+        days, hours, minutes, seconds = _split_dhms(abs_seconds)
         
         sign = "-" if total_seconds < 0 else ""
         
-        self.results_text.insert(tk.END, f"Duration: {sign}{days}d {hours}h {minutes}m {seconds:.3f}s\n")
-        self.results_text.insert(tk.END, f"Friendly: {self.format_friendly(duration)}\n\n")
+        lines.append(f"Duration: {sign}{days}d {hours}h {minutes}m {seconds:.3f}s\n")
+        lines.append(f"Friendly: {self.format_friendly(duration)}\n\n")
         
         # Progress analysis
-        if any(keyword in expression.lower() for keyword in ['progress(', '@', '% in']):
-            self.results_text.insert(tk.END, "📊 PROGRESS ANALYSIS\n")
-            self.results_text.insert(tk.END, "-" * 40 + "\n")
+        lowered = expression.lower()
+        if any(keyword in lowered for keyword in ['progress(', '@', '% in']):
+            lines.append("📊 PROGRESS ANALYSIS\n")
+            lines.append("-" * 40 + "\n")
             
-            if 'eta' in expression.lower():
-                eta = datetime.now() + duration
-                self.results_text.insert(tk.END, f"Completion time: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            elif 'remaining' in expression.lower():
-                self.results_text.insert(tk.END, f"Time remaining: {self.format_friendly(duration)}\n")
+            # One clock read serves every completion time below
+            now = datetime.now()
+            if 'eta' in lowered:
+                eta = now + duration
+                lines.append(f"Completion time: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            elif 'remaining' in lowered:
+                lines.append(f"Time remaining: {self.format_friendly(duration)}\n")
                 if total_seconds > 0:
-                    eta = datetime.now() + duration
-                    self.results_text.insert(tk.END, f"Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    eta = now + duration
+                    lines.append(f"Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
             else:
-                self.results_text.insert(tk.END, f"Total duration: {self.format_friendly(duration)}\n")
+                lines.append(f"Total duration: {self.format_friendly(duration)}\n")
                 # Extract percentage for context
-                percent_match = re.search(r'(\d+(?:\.\d+)?)%', expression)
+                percent_match = _PERCENT_RE.search(expression)
                 if percent_match:
                     percent = float(percent_match.group(1))
                     remaining_pct = 100 - percent
                     remaining = duration * (remaining_pct / 100)
-                    eta = datetime.now() + remaining
-                    self.results_text.insert(tk.END, f"Remaining ({remaining_pct:.1f}%): {self.format_friendly(remaining)}\n")
-                    self.results_text.insert(tk.END, f"Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            self.results_text.insert(tk.END, "\n")
+                    eta = now + remaining
+                    lines.append(f"Remaining ({remaining_pct:.1f}%): {self.format_friendly(remaining)}\n")
+                    lines.append(f"Completion: {eta.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            lines.append("\n")
         
-        # Unit conversions
-        conversions = [
-            ("Total Seconds", f"{total_seconds:.3f}"),
-            ("Total Minutes", f"{total_seconds/60:.3f}"),
-            ("Total Hours", f"{total_seconds/3600:.3f}"),
-            ("Total Days", f"{total_seconds/86400:.3f}"),
-        ]
+        # Unit conversions (labels are fixed, so they are pre-padded to the
+        # 14-character column)
+        lines.append(f"Total Seconds : {total_seconds:.3f}\n"
+                     f"Total Minutes : {total_seconds/60:.3f}\n"
+                     f"Total Hours   : {total_seconds/3600:.3f}\n"
+                     f"Total Days    : {total_seconds/86400:.3f}\n")
         
-        for label, value in conversions:
-            self.results_text.insert(tk.END, f"{label:14}: {value}\n")
+        return ''.join(lines)
 
     def display_datetime_result(self, dt):
-        """Display datetime results"""
-        self.results_text.insert(tk.END, "📅 DATE/TIME RESULT\n")
-        self.results_text.insert(tk.END, "-" * 50 + "\n\n")
-        
-        formats = [
-            ("Standard", dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]),
-            ("ISO Format", dt.isoformat()),
-            ("12-Hour", dt.strftime("%Y-%m-%d %I:%M:%S %p")),
-            ("US Format", dt.strftime("%m/%d/%Y %I:%M:%S %p")),
-            ("Date Only", dt.strftime("%Y-%m-%d")),
-            ("Time Only", dt.strftime("%H:%M:%S.%f")[:-3]),
-            ("Weekday", dt.strftime("%A, %B %d, %Y")),
-            ("Unix Time", str(int(dt.timestamp()))),
-        ]
-        
-        for label, formatted in formats:
-            self.results_text.insert(tk.END, f"{label:12}: {formatted}\n")
+        """Build the date/time section of the results"""
+        return _datetime_result_text(dt)
 
     def format_friendly(self, duration):
         """Format duration in friendly way"""
-        total_seconds = abs(duration.total_seconds())
-        
-        days = int(total_seconds // 86400)
-        hours = int((total_seconds % 86400) // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = total_seconds % 60
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds > 0 or not parts:
-            if seconds == int(seconds):
-                parts.append(f"{int(seconds)} second{'s' if int(seconds) != 1 else ''}")
-            else:
-                parts.append(f"{seconds:.1f} seconds")
-        
-        if len(parts) == 1:
-            return parts[0]
-        elif len(parts) == 2:
-            return f"{parts[0]} and {parts[1]}"
-        else:
-            return f"{', '.join(parts[:-1])}, and {parts[-1]}"
+        return _format_friendly(duration)
 
     def show_help(self):
         """Show comprehensive help"""
-        help_text = """📖 ADVANCED TIME CALCULATOR - HELP
-
-🕐 TIME FORMATS:
-• 24-hour: 14:30, 14:30:45, 14:30:45.5
-• 12-hour: 2:30pm, 2:30:45pm, 4:30p, 9:15a
-• Current: now
-
-📅 DATE FORMATS:
-• ISO: 2025-08-19, 2025-08-19 14:30:45
-• US: 08/19/2025, 08/19/2025 2:30pm
-• International: 2025/08/19, 2025/08/19 16:51:00
-
-⏱️ DURATION UNITS:
-• y = years, mo = months, w = weeks, d = days
-• h = hours, m = minutes, s = seconds
-• Compound: 1h15s, 2h30m45s, 1d12h30m
-
-🧮 OPERATIONS:
-• now + 30m
-• 4:30pm + 3s
-• 3s + 4:30pm  
-• 2025-12-25 - now
-• 3d + now
-• 3 * 2h 30m
-
-📊 PROGRESS ESTIMATION:
-• 1h15s@15% (total time if 15% done)
-• progress(2h30m, 35%, remaining)
-• 15% in 1h15s
-
-⌨️ SHORTCUTS:
-• Enter: Calculate
-• Ctrl+L: Clear
-• F1: Help
-
-Examples of fixed issues:
-• 3s + 4:30pm ✓
-• 4:30pm + 3s ✓  
-• 4:30pm + 1h ✓
-• 9:15a + 2h ✓"""
-
-        messagebox.showinfo("Help", help_text)
+        messagebox.showinfo("Help", _HELP_TEXT)
 
 
 def main():